@@ -1,6 +1,8 @@
-from inspect import stack
-from typing import ClassVar, Dict, Type
-from dataclasses import asdict, dataclass
+import sys
+from types import MappingProxyType
+from typing import (Any, ClassVar, Dict, Iterable, List, Mapping, Optional,
+                    Tuple, Type)
+from dataclasses import dataclass
 
 
 NOT_IMPLEM_ERROR_MESSAGE: str = ('в классе {} необходимо '
@@ -10,10 +12,13 @@ VALUE_ERROR_MESSAGE: str = ('Тип тренировки "{}" '
                             'отсутствует в БД фитнесс-трекера')
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories',
+                 '_cache')
+
     training_type: str
     duration: float
     distance: float
@@ -28,15 +33,40 @@ class InfoMessage:
 
     def get_message(self) -> str:
         """Получить строку сообщения о тренировке."""
-        return self.MESSAGE_TEXT.format(**asdict(self))
+        fields: Dict[str, Any] = {
+            'training_type': self.training_type,
+            'duration': self.duration,
+            'distance': self.distance,
+            'speed': self.speed,
+            'calories': self.calories,
+        }
+        cache: Optional[Tuple[Dict[str, Any], str]] = getattr(
+            self, '_cache', None
+        )
+        if cache is not None and cache[0] == fields:
+            return cache[1]
+        message: str = self.MESSAGE_TEXT.format_map(fields)
+        self._cache = (fields, message)
+        return message
 
 
 class Training:
-    """Базовый класс тренировки."""
+    """Базовый класс тренировки.
+
+    Дистанция и средняя скорость вычисляются один раз и запоминаются,
+    поэтому данные тренировки не должны изменяться после первого
+    обращения к ним.
+    """
 
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
     MINUTES_IN_HOUR: int = 60
+    TRAINING_TYPE_NAME: str = 'Training'
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        if 'TRAINING_TYPE_NAME' not in cls.__dict__:
+            cls.TRAINING_TYPE_NAME = cls.__name__
 
     def __init__(self,
                  action: int,
@@ -46,28 +76,34 @@ class Training:
         self.action = action
         self.duration = duration
         self.weight = weight
+        self._distance: Optional[float] = None
+        self._speed: Optional[float] = None
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return (self.action
-                * self.LEN_STEP
-                / self.M_IN_KM)
+        if self._distance is None:
+            self._distance = (self.action
+                              * self.LEN_STEP
+                              / self.M_IN_KM)
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        if self._speed is None:
+            self._speed = self.get_distance() / self.duration
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError(
             NOT_IMPLEM_ERROR_MESSAGE.format(
-                self.__class__.__name__, stack()[0].function
+                self.__class__.__name__, 'get_spent_calories'
             )
         )
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(self.__class__.__name__,
+        return InfoMessage(self.TRAINING_TYPE_NAME,
                            self.duration,
                            self.get_distance(),
                            self.get_mean_speed(),
@@ -136,10 +172,12 @@ class Swimming(Training):
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return (self.length_pool
-                * self.count_pool
-                / self.M_IN_KM
-                / self.duration)
+        if self._speed is None:
+            self._speed = (self.length_pool
+                           * self.count_pool
+                           / self.M_IN_KM
+                           / self.duration)
+        return self._speed
 
     def get_spent_calories(self) -> float:
         return ((self.get_mean_speed()
@@ -148,24 +186,39 @@ class Swimming(Training):
                 * self.weight)
 
 
-TRAINING_TYPES: Dict[str, Type[Training]] = {
+TRAINING_TYPES: Mapping[str, Type[Training]] = MappingProxyType({
     'SWM': Swimming,
     'RUN': Running,
     'WLK': SportsWalking,
-}
+})
 
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    if workout_type not in TRAINING_TYPES:
-        raise ValueError(VALUE_ERROR_MESSAGE.format(workout_type))
-    return TRAINING_TYPES[workout_type](*data)
+    try:
+        training_class: Type[Training] = TRAINING_TYPES[workout_type]
+    except KeyError:
+        raise ValueError(VALUE_ERROR_MESSAGE.format(workout_type)) from None
+    return training_class(*data)
+
+
+def read_packages(workout_type: str, data: List[list]) -> List[Training]:
+    """Прочитать серию однотипных пакетов данных от датчиков."""
+    try:
+        training_class: Type[Training] = TRAINING_TYPES[workout_type]
+    except KeyError:
+        raise ValueError(VALUE_ERROR_MESSAGE.format(workout_type)) from None
+    return [training_class(*package) for package in data]
 
 
-def main(training: Training) -> None:
+def main(trainings: Iterable[Training]) -> None:
     """Главная функция."""
-    info: InfoMessage = training.show_training_info()
-    print(info.get_message())
+    output: str = ''.join([
+        training.show_training_info().get_message() + '\n'
+        for training in trainings
+    ])
+    if output:
+        sys.stdout.write(output)
 
 
 if __name__ == '__main__':
@@ -175,6 +228,5 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training: Training = read_package(workout_type, data)
-        main(training)
+    main(read_package(workout_type, data)
+         for workout_type, data in packages)
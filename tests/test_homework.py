@@ -1,4 +1,6 @@
 import re
+import copy
+import pickle
 import pytest
 import types
 import inspect
@@ -41,6 +43,37 @@ def test_read_package_return(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('RUN', [15000, 1, 75, 180]),
+    ('RUN', [15000, 1]),
+    ('SWM', [720, 1, 80, 25, 40, 1]),
+])
+def test_read_package_wrong_data_length(input_data):
+    with pytest.raises(TypeError):
+        homework.read_package(*input_data)
+
+
+def test_read_packages():
+    assert isinstance(homework.read_packages, types.FunctionType), (
+        'Проверьте, что `read_packages` - это функция.'
+    )
+    result = homework.read_packages('RUN', [[15000, 1, 75], [9000, 1, 75]])
+    assert [training.__class__.__name__ for training in result] == [
+        'Running', 'Running'
+    ], (
+        'Функция `read_packages` должна возвращать список тренировок '
+        'указанного вида.'
+    )
+    assert [training.action for training in result] == [15000, 9000], (
+        'Функция `read_packages` должна сохранять порядок пакетов.'
+    )
+
+
+def test_read_packages_unknown_type():
+    with pytest.raises(ValueError):
+        homework.read_packages('XXX', [[15000, 1, 75]])
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         'Проверьте, что `InfoMessage` - это класс.'
@@ -102,6 +135,44 @@ def test_InfoMessage_get_message(input_data, expected):
     )
 
 
+def test_InfoMessage_get_message_cached():
+    info_message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    first = info_message.get_message()
+    assert info_message.get_message() is first, (
+        'Повторный вызов `get_message` должен возвращать '
+        'сохранённую строку.'
+    )
+
+
+def test_InfoMessage_get_message_after_change():
+    info_message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    first = info_message.get_message()
+    info_message.calories = 99
+    result = info_message.get_message()
+    assert result != first, (
+        'После изменения данных `get_message` не должен возвращать '
+        'сохранённую ранее строку.'
+    )
+    assert result.endswith('Потрачено ккал: 99.000.')
+
+
+@pytest.mark.parametrize('clone', [
+    copy.copy,
+    copy.deepcopy,
+    lambda info_message: pickle.loads(pickle.dumps(info_message)),
+])
+def test_InfoMessage_copy(clone):
+    info_message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    expected = info_message.get_message()
+    result = clone(info_message)
+    assert result.get_message() == expected, (
+        'Копия `InfoMessage` должна формировать то же сообщение.'
+    )
+    result.calories = 99
+    assert result.get_message().endswith('Потрачено ккал: 99.000.')
+    assert info_message.get_message() == expected
+
+
 def test_Training():
     assert inspect.isclass(homework.Training), (
         'Проверьте, что `Training` - это класс.'
@@ -294,6 +365,21 @@ def test_SportsWalking_get_spent_calories(input_data, expected):
     )
 
 
+def test_training_type_name():
+    assert homework.Running.TRAINING_TYPE_NAME == 'Running', (
+        'Подклассы `Training` должны по умолчанию использовать '
+        'имя класса в качестве названия тренировки.'
+    )
+
+    class CustomRunning(homework.Running):
+        TRAINING_TYPE_NAME = 'Бег'
+
+    assert CustomRunning.TRAINING_TYPE_NAME == 'Бег', (
+        'Заданное в подклассе `TRAINING_TYPE_NAME` не должно '
+        'перезаписываться.'
+    )
+
+
 def test_Running():
     assert hasattr(homework, 'Running'), 'Создайте класс `Running`'
     assert inspect.isclass(homework.Running), (
@@ -359,7 +445,65 @@ def test_main():
 def test_main_output(input_data, expected):
     with Capturing() as get_message_output:
         training = homework.read_package(*input_data)
-        homework.main(training)
+        homework.main([training])
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_main_single_write(monkeypatch):
+    writes = []
+
+    class FakeStdout:
+        def write(self, text):
+            writes.append(text)
+
+    monkeypatch.setattr(homework.sys, 'stdout', FakeStdout())
+    homework.main([
+        homework.read_package('RUN', [15000, 1, 75]),
+        homework.read_package('WLK', [9000, 1, 75, 180]),
+    ])
+    assert len(writes) == 1, (
+        'Функция `main` должна выводить все сообщения одной записью.'
+    )
+    assert writes[0].count('\n') == 2
+
+
+def test_main_output_no_trainings():
+    with Capturing() as get_message_output:
+        homework.main([])
+    assert get_message_output == [], (
+        'Без тренировок функция `main` не должна ничего печатать.'
+    )
+
+
+def test_main_output_several_trainings():
+    with Capturing() as get_message_output:
+        homework.main(
+            homework.read_package(workout_type, data)
+            for workout_type, data in [
+                ('SWM', [720, 1, 80, 25, 40]),
+                ('RUN', [1206, 12, 6]),
+                ('WLK', [9000, 1, 75, 180]),
+            ]
+        )
+    assert get_message_output == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: Running; '
+        'Длительность: 12.000 ч.; '
+        'Дистанция: 0.784 км; '
+        'Ср. скорость: 0.065 км/ч; '
+        'Потрачено ккал: -81.320.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.',
+    ], (
+        'Функция `main` должна печатать сообщения обо всех '
+        'тренировках в порядке их поступления.\n'
+    )